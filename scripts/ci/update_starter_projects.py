@@ -23,9 +23,11 @@ async def main():
     create_or_update_starter_projects function directly to avoid sql interactions.
     """
     await initialize_services(fix_migration=False)
-    all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
-
-    starter_projects = await load_starter_projects()
+    # Building the types dict and reading the project files are independent, so run them together
+    all_types_dict, starter_projects = await asyncio.gather(
+        get_and_cache_all_types_dict(get_settings_service()),
+        load_starter_projects(),
+    )
     for project_path, project in starter_projects:
         _, _, _, _, project_data, _, _, _, _ = get_project_data(project)
         do_update_starter_projects = os.environ.get("LANGFLOW_UPDATE_STARTER_PROJECTS", "true").lower() == "true"
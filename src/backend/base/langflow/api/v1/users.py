@@ -14,6 +14,7 @@ from langflow.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from langflow.services.database.models.api_key.crud import evict_checked_keys_for_user
 from langflow.services.database.models.folder.utils import create_default_folder_if_it_doesnt_exist
 from langflow.services.database.models.user import User, UserCreate, UserRead, UserUpdate
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
@@ -96,7 +97,9 @@ async def patch_user(
     if user_db := await get_user_by_id(session, user_id):
         if not update_password:
             user_update.password = user_db.password
-        return await update_user(user_db, user_update, session)
+        updated_user = await update_user(user_db, user_update, session)
+        evict_checked_keys_for_user(user_id)
+        return updated_user
     raise HTTPException(status_code=404, detail="User not found")
 
 
@@ -142,5 +145,6 @@ async def delete_user(
 
     await session.delete(user_db)
     await session.commit()
+    evict_checked_keys_for_user(user_id)
 
     return {"detail": "User deleted"}
@@ -0,0 +1,74 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from langflow.field_typing import Embeddings
+
+MAX_CACHED_EMBEDDINGS = 10_000
+
+# Components build a new wrapper on every run, so the vectors live in one process-wide LRU
+# that every wrapper shares. Keys hash the model, endpoint and credential with the text
+_embeddings_cache: OrderedDict[bytes, list[float]] = OrderedDict()
+_embeddings_cache_lock = threading.Lock()
+
+
+def _get_cached_embedding(key: bytes) -> list[float] | None:
+    with _embeddings_cache_lock:
+        embedding = _embeddings_cache.get(key)
+        if embedding is not None:
+            _embeddings_cache.move_to_end(key)
+        return embedding
+
+
+def _set_cached_embedding(key: bytes, embedding: list[float]) -> None:
+    with _embeddings_cache_lock:
+        _embeddings_cache[key] = embedding
+        _embeddings_cache.move_to_end(key)
+        while len(_embeddings_cache) > MAX_CACHED_EMBEDDINGS:
+            _embeddings_cache.popitem(last=False)
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper backed by a bounded LRU cache shared across builds.
+
+    Vectors are keyed by a hash of the model name, endpoint, credential and text,
+    so identical chunks and queries are only sent to the provider once, even when
+    a later run builds a new wrapper. Different models, endpoints or accounts never
+    share vectors, and the credential itself is never stored.
+    """
+
+    def __init__(self, inner: Embeddings, model_name: str = "", endpoint: str = "", credential: str = "") -> None:
+        self.inner = inner
+        self.model_name = model_name
+        self._namespace = hashlib.sha256(f"{model_name}\0{endpoint}\0{credential}".encode()).digest()
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(self._namespace + text.encode()).digest()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys = [self._key(text) for text in texts]
+        embeddings: list[list[float] | None] = [_get_cached_embedding(key) for key in keys]
+
+        # Group the misses by key so duplicated texts are embedded only once
+        misses: dict[bytes, list[int]] = {}
+        for index, (key, embedding) in enumerate(zip(keys, embeddings, strict=True)):
+            if embedding is None:
+                misses.setdefault(key, []).append(index)
+
+        if misses:
+            miss_texts = [texts[indexes[0]] for indexes in misses.values()]
+            miss_embeddings = self.inner.embed_documents(miss_texts)
+            for (key, indexes), miss_embedding in zip(misses.items(), miss_embeddings, strict=True):
+                _set_cached_embedding(key, miss_embedding)
+                for index in indexes:
+                    embeddings[index] = miss_embedding
+
+        return embeddings  # type: ignore[return-value]
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._key(text)
+        embedding = _get_cached_embedding(key)
+        if embedding is None:
+            embedding = self.inner.embed_query(text)
+            _set_cached_embedding(key, embedding)
+        return embedding
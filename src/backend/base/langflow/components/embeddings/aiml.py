@@ -1,4 +1,5 @@
 from langflow.base.embeddings.aiml_embeddings import AIMLEmbeddingsImpl
+from langflow.base.embeddings.cached_embeddings import CachedEmbeddings
 from langflow.base.embeddings.model import LCEmbeddingsModel
 from langflow.field_typing import Embeddings
 from langflow.inputs.inputs import DropdownInput
@@ -31,7 +32,13 @@ class AIMLEmbeddingsComponent(LCEmbeddingsModel):
     ]
 
     def build_embeddings(self) -> Embeddings:
-        return AIMLEmbeddingsImpl(
+        embeddings = AIMLEmbeddingsImpl(
             api_key=self.aiml_api_key,
             model=self.model_name,
         )
+        return CachedEmbeddings(
+            embeddings,
+            model_name=self.model_name,
+            endpoint=embeddings.embeddings_completion_url,
+            credential=embeddings.api_key.get_secret_value(),
+        )
@@ -1,10 +1,30 @@
-from .create_list import CreateListComponent
-from .current_date import CurrentDateComponent
-from .id_generator import IDGeneratorComponent
-from .memory import MemoryComponent
-from .output_parser import OutputParserComponent
-from .store_message import MessageStoreComponent
-from .structured_output import StructuredOutputComponent
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Components are imported on first access so that importing one helper
+# does not pull in the dependencies of all the others
+_LAZY_IMPORTS = {
+    "CreateListComponent": "create_list",
+    "CurrentDateComponent": "current_date",
+    "IDGeneratorComponent": "id_generator",
+    "MemoryComponent": "memory",
+    "MessageStoreComponent": "store_message",
+    "OutputParserComponent": "output_parser",
+    "StructuredOutputComponent": "structured_output",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CreateListComponent",
@@ -1,3 +1,5 @@
+from itertools import islice
+
 from langflow.custom import Component
 from langflow.helpers.data import data_to_text
 from langflow.inputs import HandleInput
@@ -39,7 +41,7 @@ class MemoryComponent(Component):
             name="n_messages",
             display_name="Number of Messages",
             value=100,
-            info="Number of messages to retrieve.",
+            info="Number of messages to retrieve, counted after the sender filter. 0 retrieves all of them.",
             advanced=True,
         ),
         MessageTextInput(
@@ -72,12 +74,32 @@ class MemoryComponent(Component):
         Output(display_name="Text", name="messages_text", method="retrieve_messages_as_text"),
     ]
 
-    async def retrieve_messages(self) -> Data:
+    _cached_messages: tuple[tuple, list[Data]] | None = None
+
+    def _pre_run_setup(self):
+        # Messages are only reused between the outputs of a single run
+        self._cached_messages = None
+
+    def _reuses_messages(self) -> bool:
+        # _current_output is only set while _build_results builds the outputs of a run. Direct calls,
+        # such as a tool invocation, must always read the latest messages
+        return bool(self._current_output)
+
+    async def retrieve_messages(self) -> list[Data]:
         sender = self.sender
         sender_name = self.sender_name
         session_id = self.session_id
         n_messages = self.n_messages
         order = "DESC" if self.order == "Descending" else "ASC"
+        if n_messages is not None and n_messages < 0:
+            msg = f"Number of Messages must be zero or more, got {n_messages}."
+            raise ValueError(msg)
+
+        cache_key = (sender, sender_name, session_id, n_messages, order, id(self.memory))
+        if self._reuses_messages() and self._cached_messages is not None and self._cached_messages[0] == cache_key:
+            stored = self._cached_messages[1]
+            self.status = stored
+            return stored
 
         if sender == "Machine and User":
             sender = None
@@ -86,24 +108,27 @@ class MemoryComponent(Component):
             # override session_id
             self.memory.session_id = session_id
 
-            stored = await self.memory.aget_messages()
+            lc_messages = await self.memory.aget_messages()
             # langchain memories are supposed to return messages in ascending order
-            if order == "DESC":
-                stored = stored[::-1]
-            if n_messages:
-                stored = stored[:n_messages]
-            stored = [Message.from_lc_message(m) for m in stored]
+            ordered = reversed(lc_messages) if order == "DESC" else lc_messages
+            messages = (Message.from_lc_message(m) for m in ordered)
             if sender:
-                expected_type = MESSAGE_SENDER_AI if sender == MESSAGE_SENDER_AI else MESSAGE_SENDER_USER
-                stored = [m for m in stored if m.type == expected_type]
+                expected_sender = MESSAGE_SENDER_AI if sender == MESSAGE_SENDER_AI else MESSAGE_SENDER_USER
+                messages = (m for m in messages if m.sender == expected_sender)
+            # stop converting as soon as enough messages have been collected
+            stored = list(islice(messages, n_messages)) if n_messages else list(messages)
         else:
-            stored = await aget_messages(
-                sender=sender,
-                sender_name=sender_name,
-                session_id=session_id,
-                limit=n_messages,
-                order=order,
+            stored = list(
+                await aget_messages(
+                    sender=sender,
+                    sender_name=sender_name,
+                    session_id=session_id,
+                    limit=n_messages,
+                    order=order,
+                )
             )
+        if self._reuses_messages():
+            self._cached_messages = (cache_key, stored)
         self.status = stored
         return stored
 
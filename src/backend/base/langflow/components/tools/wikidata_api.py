@@ -1,6 +1,10 @@
+import atexit
+import threading
+from functools import cache
 from typing import Any
 
 import httpx
+from cachetools import TTLCache
 from langchain_core.tools import StructuredTool, ToolException
 from pydantic import BaseModel, Field
 
@@ -8,6 +12,38 @@ from langflow.base.langchain_utilities.model import LCToolComponent
 from langflow.field_typing import Tool
 from langflow.inputs import MultilineInput
 from langflow.schema import Data
+from langflow.utils.version import get_version_info
+
+# Search results shared by every wrapper instance, keyed by (api url, query)
+_results_cache: TTLCache = TTLCache(maxsize=1024, ttl=60 * 60)
+_results_cache_lock = threading.Lock()
+
+
+def _get_cached_results(key: tuple[str, str]) -> list[dict[str, Any]] | None:
+    with _results_cache_lock:
+        results = _results_cache.get(key)
+    return list(results) if results is not None else None
+
+
+def _set_cached_results(key: tuple[str, str], results: list[dict[str, Any]]) -> None:
+    with _results_cache_lock:
+        _results_cache[key] = tuple(results)
+
+
+# Settings shared by the sync and async clients. Wikimedia asks API clients to identify themselves
+_CLIENT_OPTIONS: dict[str, Any] = {
+    "http2": True,
+    "timeout": 10.0,
+    "headers": {"User-Agent": f"langflow/{get_version_info()['version']} (https://github.com/langflow-ai/langflow)"},
+}
+
+
+@cache
+def _get_client() -> httpx.Client:
+    # One pooled HTTP/2 client for the sync path so repeated searches reuse the connection
+    client = httpx.Client(**_CLIENT_OPTIONS)
+    atexit.register(client.close)
+    return client
 
 
 class WikidataSearchSchema(BaseModel):
@@ -19,32 +55,67 @@ class WikidataAPIWrapper(BaseModel):
 
     wikidata_api_url: str = "https://www.wikidata.org/w/api.php"
 
-    def results(self, query: str) -> list[dict[str, Any]]:
+    @staticmethod
+    def _params(query: str) -> dict[str, str]:
         # Define request parameters for Wikidata API
-        params = {
+        return {
             "action": "wbsearchentities",
             "format": "json",
             "search": query,
             "language": "en",
         }
 
+    def results(self, query: str) -> list[dict[str, Any]]:
+        cache_key = (self.wikidata_api_url, query)
+        results = _get_cached_results(cache_key)
+        if results is not None:
+            return results
+
         # Send request to Wikidata API
-        response = httpx.get(self.wikidata_api_url, params=params)
+        response = _get_client().get(self.wikidata_api_url, params=self._params(query))
         response.raise_for_status()
         response_json = response.json()
 
         # Extract and return search results
-        return response_json.get("search", [])
+        results = response_json.get("search", [])
+        _set_cached_results(cache_key, results)
+        return results
+
+    async def aresults(self, query: str) -> list[dict[str, Any]]:
+        cache_key = (self.wikidata_api_url, query)
+        results = _get_cached_results(cache_key)
+        if results is not None:
+            return results
+
+        # An async client is bound to the event loop that opened its connections, so it is not shared
+        async with httpx.AsyncClient(**_CLIENT_OPTIONS) as client:
+            response = await client.get(self.wikidata_api_url, params=self._params(query))
+        response.raise_for_status()
+        results = response.json().get("search", [])
+        _set_cached_results(cache_key, results)
+        return results
+
+    @staticmethod
+    def _check_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if results:
+            return results
+
+        error_message = "No search results found for the given query."
+
+        raise ToolException(error_message)
 
     def run(self, query: str) -> list[dict[str, Any]]:
         try:
-            results = self.results(query)
-            if results:
-                return results
+            return self._check_results(self.results(query))
 
-            error_message = "No search results found for the given query."
+        except Exception as e:
+            error_message = f"Error in Wikidata Search API: {e!s}"
 
-            raise ToolException(error_message)
+            raise ToolException(error_message) from e
+
+    async def arun(self, query: str) -> list[dict[str, Any]]:
+        try:
+            return self._check_results(await self.aresults(query))
 
         except Exception as e:
             error_message = f"Error in Wikidata Search API: {e!s}"
@@ -75,6 +146,7 @@ class WikidataAPIComponent(LCToolComponent):
             name="wikidata_search_api",
             description="Perform similarity search on Wikidata API",
             func=wrapper.run,
+            coroutine=wrapper.arun,
             args_schema=WikidataSearchSchema,
         )
 
@@ -109,9 +109,8 @@ class UnstructuredComponent(BaseFileComponent):
             **args,
         )
 
-        documents = loader.load()
-
-        processed_data: list[Data | None] = [Data.from_document(doc) if doc else None for doc in documents]
+        # Stream the parsed elements so each one can be released as soon as it is converted
+        processed_data: list[Data | None] = list(map(Data.from_document, loader.lazy_load()))
 
         # Rename the `source` field to `self.SERVER_FILE_PATH_FIELDNAME`, to avoid conflicts with the `source` field
         for data in processed_data:
@@ -1542,11 +1542,17 @@ class Graph:
 
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
-        for v_id in sorted(vertex_successors_ids):
-            if not self.is_vertex_runnable(v_id):
-                next_runnable_vertices.update(self.find_runnable_predecessors_for_successor(v_id))
-            else:
+        successors_ids = set(vertex_successors_ids)
+        # Only successors that are queued and not already running can be runnable,
+        # so the others skip the vertex lookup in is_vertex_runnable
+        candidates = successors_ids.intersection(self.run_manager.vertices_to_run).difference(
+            self.run_manager.vertices_being_run
+        )
+        for v_id in sorted(successors_ids):
+            if v_id in candidates and self.is_vertex_runnable(v_id):
                 next_runnable_vertices.add(v_id)
+            else:
+                next_runnable_vertices.update(self.find_runnable_predecessors_for_successor(v_id))
 
         return sorted(next_runnable_vertices)
 
@@ -1555,13 +1561,12 @@ class Graph:
         v_successors_ids = vertex.successors_ids
         async with lock:
             self.run_manager.remove_vertex_from_runnables(v_id)
-            next_runnable_vertices = self.find_next_runnable_vertices(v_successors_ids)
-
-            for next_v_id in set(next_runnable_vertices):  # Use set to avoid duplicates
-                if next_v_id == v_id:
-                    next_runnable_vertices.remove(v_id)
-                else:
-                    self.run_manager.add_to_vertices_being_run(next_v_id)
+            # find_next_runnable_vertices already returns sorted unique ids, so only the vertex itself is dropped
+            next_runnable_vertices = [
+                next_v_id for next_v_id in self.find_next_runnable_vertices(v_successors_ids) if next_v_id != v_id
+            ]
+            for next_v_id in next_runnable_vertices:
+                self.run_manager.add_to_vertices_being_run(next_v_id)
             if cache and self.flow_id is not None:
                 set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
                 await set_cache_coro(data=self, lock=lock)
@@ -2110,29 +2115,31 @@ class Graph:
         immediately runnable, expanding the search to ensure progress can be made.
         """
         runnable_vertices = []
+        find_runnable_predecessors = self.find_runnable_predecessors_for_successor
         for successor_id in self.run_manager.run_map.get(vertex_id, []):
-            runnable_vertices.extend(self.find_runnable_predecessors_for_successor(successor_id))
+            runnable_vertices.extend(find_runnable_predecessors(successor_id))
 
         return sorted(runnable_vertices)
 
     def find_runnable_predecessors_for_successor(self, vertex_id: str) -> list[str]:
         runnable_vertices = []
         visited = set()
-
-        def find_runnable_predecessors(predecessor: Vertex) -> None:
-            predecessor_id = predecessor.id
+        # Bound once since they are looked up for every predecessor visited
+        get_predecessors = self.run_manager.run_predecessors.get
+        is_vertex_runnable = self.run_manager.is_vertex_runnable
+        get_vertex = self.get_vertex
+
+        # Depth-first search with an explicit stack so deep graphs don't hit the recursion limit
+        stack = list(get_predecessors(vertex_id, []))
+        while stack:
+            predecessor_id = stack.pop()
             if predecessor_id in visited:
-                return
+                continue
             visited.add(predecessor_id)
-            is_active = self.get_vertex(predecessor_id).is_active()
-            if self.run_manager.is_vertex_runnable(predecessor_id, is_active=is_active):
+            if is_vertex_runnable(predecessor_id, is_active=get_vertex(predecessor_id).is_active()):
                 runnable_vertices.append(predecessor_id)
             else:
-                for pred_pred_id in self.run_manager.run_predecessors.get(predecessor_id, []):
-                    find_runnable_predecessors(self.get_vertex(pred_pred_id))
-
-        for predecessor_id in self.run_manager.run_predecessors.get(vertex_id, []):
-            find_runnable_predecessors(self.get_vertex(predecessor_id))
+                stack.extend(get_predecessors(predecessor_id, []))
         return runnable_vertices
 
     def remove_from_predecessors(self, vertex_id: str) -> None:
@@ -3,15 +3,23 @@ from collections import defaultdict
 
 class RunnableVerticesManager:
     def __init__(self):
-        self.run_map: dict[str, list[str]] = defaultdict(list)  # Tracks successors of each vertex
+        self.run_map: dict[str, set[str]] = defaultdict(set)  # Tracks successors of each vertex
         self.run_predecessors: dict[str, set[str]] = defaultdict(set)  # Tracks predecessors for each vertex
         self.vertices_to_run: set[str] = set()  # Set of vertices that are ready to run
         self.vertices_being_run: set[str] = set()  # Set of vertices that are currently running
         self.cycle_vertices: set[str] = set()  # Set of vertices that are in a cycle
 
+    @staticmethod
+    def _run_map_from_lists(run_map: dict) -> dict[str, set[str]]:
+        return defaultdict(set, {vertex_id: set(successors) for vertex_id, successors in run_map.items()})
+
+    def _run_map_to_lists(self) -> dict[str, list[str]]:
+        # Successors are stored as sets but serialized as lists to stay JSON compatible
+        return {vertex_id: list(successors) for vertex_id, successors in self.run_map.items()}
+
     def to_dict(self) -> dict:
         return {
-            "run_map": self.run_map,
+            "run_map": self._run_map_to_lists(),
             "run_predecessors": self.run_predecessors,
             "vertices_to_run": self.vertices_to_run,
             "vertices_being_run": self.vertices_being_run,
@@ -20,7 +28,7 @@ class RunnableVerticesManager:
     @classmethod
     def from_dict(cls, data: dict) -> "RunnableVerticesManager":
         instance = cls()
-        instance.run_map = data["run_map"]
+        instance.run_map = cls._run_map_from_lists(data["run_map"])
         instance.run_predecessors = data["run_predecessors"]
         instance.vertices_to_run = data["vertices_to_run"]
         instance.vertices_being_run = data["vertices_being_run"]
@@ -28,14 +36,14 @@ class RunnableVerticesManager:
 
     def __getstate__(self) -> object:
         return {
-            "run_map": self.run_map,
+            "run_map": self._run_map_to_lists(),
             "run_predecessors": self.run_predecessors,
             "vertices_to_run": self.vertices_to_run,
             "vertices_being_run": self.vertices_being_run,
         }
 
     def __setstate__(self, state: dict) -> None:
-        self.run_map = state["run_map"]
+        self.run_map = self._run_map_from_lists(state["run_map"])
         self.run_predecessors = state["run_predecessors"]
         self.vertices_to_run = state["vertices_to_run"]
         self.vertices_being_run = state["vertices_being_run"]
@@ -44,36 +52,36 @@ class RunnableVerticesManager:
         return all(not value for value in self.run_predecessors.values())
 
     def update_run_state(self, run_predecessors: dict, vertices_to_run: set) -> None:
+        # Only the edges of the updated vertices are added, instead of rebuilding the whole run map
+        for vertex_id, predecessors in run_predecessors.items():
+            for predecessor in predecessors:
+                self.run_map[predecessor].add(vertex_id)
         self.run_predecessors.update(run_predecessors)
         self.vertices_to_run.update(vertices_to_run)
-        self.build_run_map(self.run_predecessors, self.vertices_to_run)
 
     def is_vertex_runnable(self, vertex_id: str, *, is_active: bool) -> bool:
         """Determines if a vertex is runnable."""
-        if not is_active:
-            return False
-        if vertex_id in self.vertices_being_run:
-            return False
-        if vertex_id not in self.vertices_to_run:
+        # Cheapest checks first; the predecessor lookup only runs for candidates that pass them
+        if not is_active or vertex_id in self.vertices_being_run or vertex_id not in self.vertices_to_run:
             return False
-        return self.are_all_predecessors_fulfilled(vertex_id) or vertex_id in self.cycle_vertices
+        return not any(self.run_predecessors.get(vertex_id, ())) or vertex_id in self.cycle_vertices
 
     def are_all_predecessors_fulfilled(self, vertex_id: str) -> bool:
         return not any(self.run_predecessors.get(vertex_id, []))
 
     def remove_from_predecessors(self, vertex_id: str) -> None:
         """Removes a vertex from the predecessor list of its successors."""
-        predecessors = self.run_map.get(vertex_id, [])
+        predecessors = self.run_map.get(vertex_id, ())
         for predecessor in predecessors:
             if vertex_id in self.run_predecessors[predecessor]:
                 self.run_predecessors[predecessor].remove(vertex_id)
 
     def build_run_map(self, predecessor_map, vertices_to_run) -> None:
         """Builds a map of vertices and their runnable successors."""
-        self.run_map = defaultdict(list)
+        self.run_map = defaultdict(set)
         for vertex_id, predecessors in predecessor_map.items():
             for predecessor in predecessors:
-                self.run_map[predecessor].append(vertex_id)
+                self.run_map[predecessor].add(vertex_id)
         self.run_predecessors = predecessor_map.copy()
         self.vertices_to_run = vertices_to_run
 
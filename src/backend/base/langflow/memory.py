@@ -1,11 +1,12 @@
+import asyncio
 import json
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import delete, insert
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -14,6 +15,8 @@ from langflow.services.database.models.message.model import MessageRead, Message
 from langflow.services.deps import session_scope
 from langflow.utils.async_helpers import run_until_complete
 
+MESSAGES_YIELD_PER = 200
+
 
 def _get_variable_query(
     sender: str | None = None,
@@ -94,8 +97,58 @@ async def aget_messages(
     """
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
-        messages = await session.exec(stmt)
-        return [await Message.create(**d.model_dump()) for d in messages]
+        messages = (await session.exec(stmt)).all()
+    return await _amessages_from_tables(messages)
+
+
+async def aiter_messages(
+    sender: str | None = None,
+    sender_name: str | None = None,
+    session_id: str | UUID | None = None,
+    order_by: str | None = "timestamp",
+    order: str | None = "DESC",
+    flow_id: UUID | None = None,
+    limit: int | None = None,
+) -> AsyncIterator[Message]:
+    """Streams messages from the monitor service based on the provided filters.
+
+    Unlike `aget_messages`, rows are fetched in batches of `MESSAGES_YIELD_PER`,
+    so only one batch is held in memory.
+
+    The database session and cursor stay open until the generator finishes. A caller
+    that may stop early must wrap it in `contextlib.aclosing(...)`, otherwise they
+    are only released when the generator is garbage collected.
+
+    Args:
+        sender (Optional[str]): The sender of the messages (e.g., "Machine" or "User")
+        sender_name (Optional[str]): The name of the sender.
+        session_id (Optional[str]): The session ID associated with the messages.
+        order_by (Optional[str]): The field to order the messages by. Defaults to "timestamp".
+        order (Optional[str]): The order in which to retrieve the messages. Defaults to "DESC".
+        flow_id (Optional[UUID]): The flow ID associated with the messages.
+        limit (Optional[int]): The maximum number of messages to retrieve.
+
+    Yields:
+        Message: The retrieved messages.
+    """
+    async with session_scope() as session:
+        stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
+        result = await session.stream_scalars(stmt.execution_options(yield_per=MESSAGES_YIELD_PER))
+        async for partition in result.partitions():
+            for message in await _amessages_from_tables(partition):
+                yield message
+
+
+async def _amessages_from_tables(messages: Sequence[MessageTable]) -> list[Message]:
+    # Message.create would spawn one thread per row, since is_image_file is blocking.
+    # Build all of them in a single thread instead, and only when a row has files
+    if any(message.files for message in messages):
+        return await asyncio.to_thread(_messages_from_tables, messages)
+    return _messages_from_tables(messages)
+
+
+def _messages_from_tables(messages: Sequence[MessageTable]) -> list[Message]:
+    return [Message(**message.model_dump()) for message in messages]
 
 
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
@@ -149,12 +202,27 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
+    if not messages:
+        return []
     try:
-        for message in messages:
-            session.add(message)
-        await session.commit()
-        for message in messages:
-            await session.refresh(message)
+        if session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+            # Insert all the rows and read them back in a single INSERT ... RETURNING
+            insert_stmt = insert(MessageTable).returning(MessageTable, sort_by_parameter_order=True)
+            # Raw attribute values, as a flush would send them; model_dump would apply the field serializers
+            columns = [column.key for column in MessageTable.__table__.columns]  # type: ignore[attr-defined]
+            rows = [{column: getattr(message, column) for column in columns} for message in messages]
+            messages = list((await session.exec(insert_stmt, params=rows)).scalars().all())
+            await session.commit()
+        else:
+            session.add_all(messages)
+            await session.commit()
+            # Reload the stored rows with a single query instead of one refresh per message
+            select_stmt = (
+                select(MessageTable)
+                .where(col(MessageTable.id).in_([message.id for message in messages]))
+                .execution_options(populate_existing=True)
+            )
+            (await session.exec(select_stmt)).all()
     except Exception as e:
         logger.exception(e)
         raise
@@ -190,7 +258,7 @@ async def adelete_messages(session_id: str) -> None:
         stmt = (
             delete(MessageTable)
             .where(col(MessageTable.session_id) == session_id)
-            .execution_options(synchronize_session="fetch")
+            .execution_options(synchronize_session=False)
         )
         await session.exec(stmt)
 
@@ -4,8 +4,10 @@ import secrets
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from cachetools import TTLCache
+from sqlalchemy import update
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models import User
@@ -49,31 +51,67 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
+    checked_keys_cache.pop(api_key.api_key, None)
 
 
 update_total_uses_tasks: set[asyncio.Task] = set()
+# Uses not yet written to the database, by API key id. While an update is pending for a key,
+# further uses are added here instead of starting a new task and database session
+pending_total_uses: dict[UUID, int] = {}
+# Recently checked keys mapped to their id and user, so repeated requests skip the lookup.
+# Deleted keys, and the keys of updated or deleted users, are evicted right away, but only in the
+# worker that handled the change: other workers keep accepting them until their entry expires,
+# so the TTL is kept short to bound that window.
+checked_keys_cache: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+
+
+def evict_checked_keys_for_user(user_id: UUID) -> None:
+    """Drop the cached key checks of a user, so changes to it apply to the next request."""
+    for api_key, (_, user) in list(checked_keys_cache.items()):
+        if user.id == user_id:
+            checked_keys_cache.pop(api_key, None)
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
     """Check if the API key is valid."""
-    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
-    api_key_object: ApiKey | None = (await session.exec(query)).first()
-    if api_key_object is not None:
-        task = asyncio.create_task(update_total_uses(api_key_object.id))
+    cached = checked_keys_cache.get(api_key)
+    if cached is None:
+        query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
+        api_key_object: ApiKey | None = (await session.exec(query)).first()
+        if api_key_object is None:
+            return None
+        cached = checked_keys_cache[api_key] = (api_key_object.id, api_key_object.user)
+
+    api_key_id, user = cached
+    if api_key_id in pending_total_uses:
+        pending_total_uses[api_key_id] += 1
+    else:
+        pending_total_uses[api_key_id] = 1
+        task = asyncio.create_task(update_total_uses(api_key_id))
         task.add_done_callback(update_total_uses_tasks.discard)
         update_total_uses_tasks.add(task)
-        return api_key_object.user
-    return None
+    return user
 
 
 async def update_total_uses(api_key_id: UUID):
     """Update the total uses and last used at."""
-    async with session_getter(get_db_service()) as session:
-        new_api_key = await session.get(ApiKey, api_key_id)
-        if new_api_key is None:
-            msg = "API Key not found"
-            raise ValueError(msg)
-        new_api_key.total_uses += 1
-        new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-        session.add(new_api_key)
-        await session.commit()
+    try:
+        async with session_getter(get_db_service()) as session:
+            uses = pending_total_uses.pop(api_key_id, 1)
+            # Increment in the database so concurrent updates can't overwrite each other
+            stmt = (
+                update(ApiKey)
+                .where(col(ApiKey.id) == api_key_id)
+                .values(
+                    total_uses=col(ApiKey.total_uses) + uses,
+                    last_used_at=datetime.datetime.now(datetime.timezone.utc),
+                )
+            )
+            result = await session.exec(stmt)
+            if result.rowcount == 0:
+                msg = "API Key not found"
+                raise ValueError(msg)
+            await session.commit()
+    except Exception:
+        pending_total_uses.pop(api_key_id, None)
+        raise
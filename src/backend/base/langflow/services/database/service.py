@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import math
 import re
 import sqlite3
 import time
@@ -10,6 +12,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import anyio
+import orjson
 import sqlalchemy as sa
 from alembic import command, util
 from alembic.config import Config
@@ -34,6 +37,38 @@ if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
+def _has_non_finite_float(value) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, list | tuple):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def _json_serializer(value) -> str:
+    # orjson is much faster on the large JSON columns (flow data, message properties and content blocks).
+    # The standard library handles the few values orjson rejects, such as integers wider than 64 bits
+    try:
+        serialized = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return json.dumps(value)
+    # orjson silently writes NaN and Infinity as null, so keep the json.dumps output for those values.
+    # Only output containing null can hide one, which keeps the extra walk off the common path
+    if b"null" in serialized and _has_non_finite_float(value):
+        return json.dumps(value)
+    return serialized.decode()
+
+
+def _json_deserializer(value: str):
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # Values written by json.dumps may contain NaN or Infinity, which orjson does not accept
+        return json.loads(value)
+
+
 class DatabaseService(Service):
     name = "database_service"
 
@@ -98,6 +133,8 @@ class DatabaseService(Service):
         return create_async_engine(
             database_url,
             connect_args=self._get_connect_args(),
+            json_serializer=_json_serializer,
+            json_deserializer=_json_deserializer,
             **kwargs,
         )
 
@@ -20,6 +20,7 @@ from httpx import ASGITransport, AsyncClient
 from langflow.graph import Graph
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.services.auth.utils import get_password_hash
+from langflow.services.database.models.api_key.crud import checked_keys_cache
 from langflow.services.database.models.api_key.model import ApiKey
 from langflow.services.database.models.flow.model import Flow, FlowCreate
 from langflow.services.database.models.folder.model import Folder
@@ -81,6 +82,12 @@ def blockbuster(request):
             yield bb
 
 
+@pytest.fixture(autouse=True)
+def clear_checked_keys_cache():
+    # Every client gets a new database, so API keys checked by a previous test must not be reused
+    checked_keys_cache.clear()
+
+
 def pytest_configure(config):
     config.addinivalue_line("markers", "noclient: don't create a client for this test")
     config.addinivalue_line("markers", "load_flows: load the flows for this test")
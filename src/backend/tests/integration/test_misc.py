@@ -1,4 +1,5 @@
-from uuid import uuid4
+import asyncio
+from uuid import UUID
 
 import pytest
 from fastapi import status
@@ -7,80 +8,78 @@ from langflow.graph.schema import RunOutputs
 from langflow.initial_setup.setup import load_starter_projects
 from langflow.load.load import arun_flow_from_json
 
+# Any valid UUID that no test flow uses
+INVALID_FLOW_ID = UUID("00000000-0000-0000-0000-000000000001")
+BASE_PAYLOAD = {"input_value": "value1", "input_type": "text", "output_type": "text", "stream": False}
+
+# Starter projects by name, loaded from disk once per session
+_starter_projects: dict[str, dict] = {}
+
+
+async def get_starter_project_by_name(name: str) -> dict:
+    if not _starter_projects:
+        _starter_projects.update({project["name"]: project for _, project in await load_starter_projects()})
+    return next(project for project_name, project in _starter_projects.items() if name in project_name)
+
 
 @pytest.mark.api_key_required
-async def test_run_flow_with_caching_success(client: AsyncClient, starter_project, created_api_key):
+@pytest.mark.parametrize(
+    "payload",
+    [
+        BASE_PAYLOAD | {"tweaks": {"parameter_name": "value"}},
+        BASE_PAYLOAD | {"tweaks": {"invalid_tweak": "value"}},
+    ],
+    ids=["with_tweaks", "invalid_tweaks"],
+)
+async def test_run_flow_with_caching_success(client: AsyncClient, starter_project, created_api_key, payload):
     flow_id = starter_project["id"]
     headers = {"x-api-key": created_api_key.api_key}
-    payload = {
-        "input_value": "value1",
-        "input_type": "text",
-        "output_type": "text",
-        "tweaks": {"parameter_name": "value"},
-        "stream": False,
-    }
     response = await client.post(f"/api/v1/run/{flow_id}", json=payload, headers=headers)
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_200_OK, response.text
     data = response.json()
     assert "outputs" in data
     assert "session_id" in data
 
 
+@pytest.mark.api_key_required
+async def test_run_flow_concurrent_requests(client: AsyncClient, starter_project, created_api_key):
+    """Runs the same flow from several sessions at once, each request must get its own session back."""
+    flow_id = starter_project["id"]
+    headers = {"x-api-key": created_api_key.api_key}
+    payloads = [BASE_PAYLOAD | {"tweaks": {}, "session_id": f"concurrent-session-{i}"} for i in range(4)]
+    responses = await asyncio.gather(
+        *(client.post(f"/api/v1/run/{flow_id}", json=payload, headers=headers) for payload in payloads)
+    )
+    for response in responses:
+        assert response.status_code == status.HTTP_200_OK, response.text
+    assert [response.json()["session_id"] for response in responses] == [payload["session_id"] for payload in payloads]
+
+
 @pytest.mark.api_key_required
 async def test_run_flow_with_caching_invalid_flow_id(client: AsyncClient, created_api_key):
-    invalid_flow_id = uuid4()
     headers = {"x-api-key": created_api_key.api_key}
-    payload = {"input_value": "", "input_type": "text", "output_type": "text", "tweaks": {}, "stream": False}
-    response = await client.post(f"/api/v1/run/{invalid_flow_id}", json=payload, headers=headers)
+    payload = BASE_PAYLOAD | {"input_value": "", "tweaks": {}}
+    response = await client.post(f"/api/v1/run/{INVALID_FLOW_ID}", json=payload, headers=headers)
     assert response.status_code == status.HTTP_404_NOT_FOUND
     data = response.json()
     assert "detail" in data
-    assert f"Flow identifier {invalid_flow_id} not found" in data["detail"]
+    assert f"Flow identifier {INVALID_FLOW_ID} not found" in data["detail"]
 
 
 @pytest.mark.api_key_required
 async def test_run_flow_with_caching_invalid_input_format(client: AsyncClient, starter_project, created_api_key):
     flow_id = starter_project["id"]
     headers = {"x-api-key": created_api_key.api_key}
-    payload = {"input_value": {"key": "value"}, "input_type": "text", "output_type": "text", "tweaks": {}}
+    payload = BASE_PAYLOAD | {"input_value": {"key": "value"}, "tweaks": {}}
     response = await client.post(f"/api/v1/run/{flow_id}", json=payload, headers=headers)
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
-@pytest.mark.api_key_required
-async def test_run_flow_with_invalid_tweaks(client, starter_project, created_api_key):
-    headers = {"x-api-key": created_api_key.api_key}
-    flow_id = starter_project["id"]
-    payload = {
-        "input_value": "value1",
-        "input_type": "text",
-        "output_type": "text",
-        "tweaks": {"invalid_tweak": "value"},
-    }
-    response = await client.post(f"/api/v1/run/{flow_id}", json=payload, headers=headers)
-    assert response.status_code == status.HTTP_200_OK
-
-
-@pytest.mark.api_key_required
-async def test_run_with_inputs_and_outputs(client, starter_project, created_api_key):
-    headers = {"x-api-key": created_api_key.api_key}
-    flow_id = starter_project["id"]
-    payload = {
-        "input_value": "value1",
-        "input_type": "text",
-        "output_type": "text",
-        "tweaks": {"parameter_name": "value"},
-        "stream": False,
-    }
-    response = await client.post(f"/api/v1/run/{flow_id}", json=payload, headers=headers)
-    assert response.status_code == status.HTTP_200_OK, response.text
-
-
 @pytest.mark.noclient
 @pytest.mark.api_key_required
 async def test_run_flow_from_json_object():
     """Test loading a flow from a json file and applying tweaks."""
-    project = next(project for _, project in await load_starter_projects() if "Basic Prompting" in project["name"])
+    project = await get_starter_project_by_name("Basic Prompting")
     results = await arun_flow_from_json(project, input_value="test", fallback_to_env_vars=True)
     assert results is not None
     assert all(isinstance(result, RunOutputs) for result in results)
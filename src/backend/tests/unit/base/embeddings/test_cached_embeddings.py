@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from unittest.mock import patch
+
+import pytest
+from langchain_core.embeddings import FakeEmbeddings
+from langflow.base.embeddings import cached_embeddings
+from langflow.base.embeddings.aiml_embeddings import AIMLEmbeddingsImpl
+from langflow.base.embeddings.cached_embeddings import CachedEmbeddings
+from langflow.components.embeddings import AIMLEmbeddingsComponent
+
+
+class CountingEmbeddings(FakeEmbeddings):
+    calls: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return super().embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append([text])
+        return super().embed_query(text)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    with patch.object(cached_embeddings, "_embeddings_cache", OrderedDict()):
+        yield
+
+
+def test_embed_documents_only_requests_misses():
+    inner = CountingEmbeddings(size=4, calls=[])
+    embeddings = CachedEmbeddings(inner, model_name="model")
+
+    first = embeddings.embed_documents(["a", "b", "a"])
+    second = embeddings.embed_documents(["b", "c", "a"])
+
+    assert inner.calls == [["a", "b"], ["c"]]
+    assert first[0] == first[2] == second[2]
+    assert first[1] == second[0]
+
+
+def test_embed_query_uses_cache():
+    inner = CountingEmbeddings(size=4, calls=[])
+    embeddings = CachedEmbeddings(inner, model_name="model")
+
+    assert embeddings.embed_query("q") == embeddings.embed_query("q")
+    assert inner.calls == [["q"]]
+
+
+@patch.object(cached_embeddings, "MAX_CACHED_EMBEDDINGS", 2)
+def test_cache_evicts_least_recently_used():
+    inner = CountingEmbeddings(size=4, calls=[])
+    embeddings = CachedEmbeddings(inner, model_name="model")
+
+    embeddings.embed_documents(["a", "b"])
+    embeddings.embed_query("a")
+    embeddings.embed_query("c")
+    embeddings.embed_documents(["a", "b"])
+
+    assert inner.calls == [["a", "b"], ["c"], ["b"]]
+
+
+def test_cache_is_shared_across_wrappers():
+    inner = CountingEmbeddings(size=4, calls=[])
+
+    first = CachedEmbeddings(inner, model_name="model", endpoint="https://example.com", credential="key")
+    second = CachedEmbeddings(inner, model_name="model", endpoint="https://example.com", credential="key")
+
+    assert first.embed_query("q") == second.embed_query("q")
+    assert inner.calls == [["q"]]
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        {"model_name": "other-model", "endpoint": "https://example.com", "credential": "key"},
+        {"model_name": "model", "endpoint": "https://other.example.com", "credential": "key"},
+        {"model_name": "model", "endpoint": "https://example.com", "credential": "other-key"},
+    ],
+)
+def test_cache_is_separated_by_model_endpoint_and_credential(other):
+    inner = CountingEmbeddings(size=4, calls=[])
+
+    CachedEmbeddings(inner, model_name="model", endpoint="https://example.com", credential="key").embed_query("q")
+    CachedEmbeddings(inner, **other).embed_query("q")
+
+    assert inner.calls == [["q"], ["q"]]
+
+
+def test_aiml_component_hits_cache_across_builds():
+    component = AIMLEmbeddingsComponent()
+    component.set(model_name="text-embedding-3-small", aiml_api_key="key")
+
+    with patch.object(AIMLEmbeddingsImpl, "embed_query", autospec=True, return_value=[0.1, 0.2]) as embed_query:
+        first = component.build_embeddings().embed_query("q")
+        second = component.build_embeddings().embed_query("q")
+
+    assert first == second == [0.1, 0.2]
+    embed_query.assert_called_once()
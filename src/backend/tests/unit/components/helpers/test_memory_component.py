@@ -0,0 +1,81 @@
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langflow.components.helpers.memory import MemoryComponent
+
+
+class FakeMemory:
+    def __init__(self, messages: list[BaseMessage]):
+        self.messages = messages
+        self.session_id: str | None = None
+        self.calls = 0
+
+    async def aget_messages(self) -> list[BaseMessage]:
+        self.calls += 1
+        return list(self.messages)
+
+
+@pytest.fixture
+def memory():
+    return FakeMemory(
+        [
+            HumanMessage(content="question 1"),
+            AIMessage(content="answer 1"),
+            HumanMessage(content="question 2"),
+            AIMessage(content="answer 2"),
+            HumanMessage(content="question 3"),
+        ]
+    )
+
+
+def build_component(memory: FakeMemory, **kwargs) -> MemoryComponent:
+    component = MemoryComponent()
+    component.set(memory=memory, session_id="session", **kwargs)
+    return component
+
+
+@pytest.mark.parametrize(
+    ("order", "expected"),
+    [
+        ("Ascending", ["question 1", "question 2"]),
+        ("Descending", ["question 3", "question 2"]),
+    ],
+)
+async def test_limit_applies_after_sender_filter(memory, order, expected):
+    component = build_component(memory, sender="User", n_messages=2, order=order)
+
+    messages = await component.retrieve_messages()
+
+    assert [message.text for message in messages] == expected
+
+
+async def test_zero_messages_retrieves_all(memory):
+    component = build_component(memory, sender="Machine and User", n_messages=0)
+
+    messages = await component.retrieve_messages()
+
+    assert len(messages) == 5
+
+
+async def test_negative_messages_is_rejected(memory):
+    component = build_component(memory, n_messages=-1)
+
+    with pytest.raises(ValueError, match="Number of Messages must be zero or more"):
+        await component.retrieve_messages()
+    assert memory.calls == 0
+
+
+async def test_outputs_of_one_run_query_the_memory_once(memory):
+    component = build_component(memory)
+
+    results, _ = await component._build_results()
+    assert len(results["messages"]) == 5
+    assert results["messages_text"].text.startswith("User: question 1")
+    assert memory.calls == 1
+
+    # A new run, or a direct call such as a tool invocation, reads the latest messages
+    component._reset_all_output_values()
+    await component._build_results()
+    assert memory.calls == 2
+    await component.retrieve_messages()
+    await component.retrieve_messages()
+    assert memory.calls == 4
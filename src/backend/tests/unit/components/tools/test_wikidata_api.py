@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+from cachetools import TTLCache
+from langflow.components.tools import wikidata_api
+from langflow.components.tools.wikidata_api import WikidataAPIWrapper
+
+SEARCH_RESULTS = [{"id": "Q42", "label": "Douglas Adams"}]
+
+
+@pytest.fixture
+def atexit_register():
+    with patch.object(wikidata_api.atexit, "register") as register:
+        yield register
+
+
+@pytest.fixture
+def requests(atexit_register):  # noqa: ARG001
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"search": SEARCH_RESULTS})
+
+    options = {**wikidata_api._CLIENT_OPTIONS, "transport": httpx.MockTransport(handler)}
+    with (
+        patch.object(wikidata_api, "_CLIENT_OPTIONS", options),
+        patch.object(wikidata_api, "_results_cache", TTLCache(maxsize=8, ttl=60)),
+    ):
+        wikidata_api._get_client.cache_clear()
+        yield requests
+    wikidata_api._get_client.cache_clear()
+
+
+async def test_aresults_uses_the_client_settings(requests):
+    results = await WikidataAPIWrapper().aresults("Douglas Adams")
+
+    assert results == SEARCH_RESULTS
+    assert len(requests) == 1
+    assert requests[0].url.params["search"] == "Douglas Adams"
+    assert requests[0].extensions["timeout"]["read"] == 10.0
+
+
+def test_repeated_query_is_served_from_cache(requests):
+    wrapper = WikidataAPIWrapper()
+
+    assert wrapper.results("Douglas Adams") == SEARCH_RESULTS
+    assert WikidataAPIWrapper().results("Douglas Adams") == SEARCH_RESULTS
+    assert len(requests) == 1
+
+    assert wrapper.results("Arthur Dent") == SEARCH_RESULTS
+    assert len(requests) == 2
+
+
+async def test_async_query_reuses_sync_results(requests):
+    WikidataAPIWrapper().results("Douglas Adams")
+
+    assert await WikidataAPIWrapper().aresults("Douglas Adams") == SEARCH_RESULTS
+    assert len(requests) == 1
+
+
+def test_client_identifies_itself_and_closes_at_exit(requests, atexit_register):
+    WikidataAPIWrapper().results("Douglas Adams")
+
+    assert requests[0].headers["User-Agent"].startswith("langflow/")
+    client = wikidata_api._get_client()
+    atexit_register.assert_called_once_with(client.close)
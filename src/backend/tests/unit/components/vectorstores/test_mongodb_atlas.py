@@ -0,0 +1,181 @@
+import threading
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langflow.components.vectorstores import MongoVectorStoreComponent
+from langflow.schema import Data
+
+MODULE = "langflow.components.vectorstores.mongodb_atlas"
+
+
+@pytest.fixture
+def mongo_client():
+    with patch(f"{MODULE}._get_mongo_client") as get_client:
+        client = MagicMock()
+        get_client.return_value = client
+        yield client
+
+
+@pytest.fixture
+def vector_store():
+    with patch(f"{MODULE}.MongoDBAtlasVectorSearch") as vector_store_cls:
+        yield vector_store_cls.return_value
+
+
+def build_component(**kwargs):
+    component = MongoVectorStoreComponent()
+    component.set(
+        mongodb_atlas_cluster_uri="mongodb+srv://cluster.example.com",
+        db_name="db",
+        collection_name="collection",
+        index_name="index",
+        embedding=MagicMock(),
+        **kwargs,
+    )
+    return component
+
+
+def collection_of(mongo_client):
+    return mongo_client["db"]["collection"]
+
+
+@pytest.mark.usefixtures("vector_store")
+def test_ingest_drops_collection_by_default(mongo_client):
+    build_component(ingest_data=[Data(text="hello")]).build_vector_store()
+
+    collection_of(mongo_client).drop.assert_called_once()
+
+
+@pytest.mark.usefixtures("vector_store")
+def test_search_without_ingest_data_keeps_collection(mongo_client):
+    build_component(ingest_data=[], search_query="hello").build_vector_store()
+
+    collection_of(mongo_client).drop.assert_not_called()
+
+
+@pytest.mark.usefixtures("vector_store")
+def test_ingest_keeps_collection_when_drop_disabled(mongo_client):
+    build_component(ingest_data=[Data(text="hello")], drop_collection=False).build_vector_store()
+
+    collection_of(mongo_client).drop.assert_not_called()
+
+
+@pytest.mark.usefixtures("mongo_client")
+def test_ingest_splits_documents_into_batches(vector_store):
+    ingest_data = [Data(text=f"doc {i}") for i in range(25)]
+
+    build_component(ingest_data=ingest_data, batch_size=10).build_vector_store()
+
+    calls = vector_store.add_documents.call_args_list
+    assert sorted(len(call.args[0]) for call in calls) == [5, 10, 10]
+    assert all(call.kwargs == {"batch_size": 10} for call in calls)
+    inserted = [doc.page_content for call in calls for doc in call.args[0]]
+    assert sorted(inserted) == sorted(f"doc {i}" for i in range(25))
+
+
+@pytest.mark.usefixtures("mongo_client")
+def test_single_batch_is_inserted_directly(vector_store):
+    build_component(ingest_data=[Data(text="hello")]).build_vector_store()
+
+    vector_store.add_documents.assert_called_once()
+    assert vector_store.add_documents.call_args.kwargs == {"batch_size": 1_000}
+
+
+@pytest.mark.usefixtures("mongo_client")
+def test_batches_are_inserted_concurrently(vector_store):
+    # Every batch waits for the others, so this only completes if all three run at the same time
+    barrier = threading.Barrier(3, timeout=5)
+    vector_store.add_documents.side_effect = lambda *_args, **_kwargs: barrier.wait()
+    ingest_data = [Data(text=f"doc {i}") for i in range(3)]
+
+    build_component(ingest_data=ingest_data, batch_size=1, bulk_insert_batch_concurrency=3).build_vector_store()
+
+    assert vector_store.add_documents.call_count == 3
+
+
+@pytest.mark.usefixtures("mongo_client")
+def test_batch_errors_are_aggregated(vector_store):
+    def add_documents(batch, **_kwargs):
+        if batch[0].page_content == "doc 1":
+            msg = "insert failed"
+            raise RuntimeError(msg)
+
+    vector_store.add_documents.side_effect = add_documents
+    ingest_data = [Data(text=f"doc {i}") for i in range(3)]
+
+    component = build_component(ingest_data=ingest_data, batch_size=1)
+    with pytest.raises(ValueError, match=r"Failed to insert 1 of 3 batches \(2 documents inserted\): insert failed"):
+        component.build_vector_store()
+    assert vector_store.add_documents.call_count == 3
+
+
+@pytest.mark.usefixtures("vector_store")
+@pytest.mark.parametrize("batch_size", [-5, 0, 100_001])
+def test_invalid_batch_size_is_rejected_before_dropping(mongo_client, batch_size):
+    component = build_component(ingest_data=[Data(text="hello")], batch_size=batch_size)
+
+    with pytest.raises(ValueError, match="Batch Size must be between 1 and 100000"):
+        component.build_vector_store()
+    collection_of(mongo_client).drop.assert_not_called()
+
+
+@pytest.fixture
+def mongo_clients():
+    from langflow.components.vectorstores import mongodb_atlas
+
+    with (
+        patch.object(mongodb_atlas, "_mongo_clients", OrderedDict()) as clients,
+        patch.object(mongodb_atlas, "_create_mongo_client") as create_client,
+    ):
+        create_client.side_effect = lambda *_args: MagicMock()
+        yield clients, create_client
+
+
+def test_mongo_client_is_shared_and_evicted_clients_stay_open(mongo_clients):
+    from langflow.components.vectorstores.mongodb_atlas import MAX_CACHED_MONGO_CLIENTS, _get_mongo_client
+
+    clients, create_client = mongo_clients
+    first = _get_mongo_client("mongodb://host-0")
+    assert _get_mongo_client("mongodb://host-0") is first
+    for i in range(1, MAX_CACHED_MONGO_CLIENTS + 1):
+        _get_mongo_client(f"mongodb://host-{i}")
+
+    assert create_client.call_count == MAX_CACHED_MONGO_CLIENTS + 1
+    assert len(clients) == MAX_CACHED_MONGO_CLIENTS
+    assert ("mongodb://host-0", None) not in clients
+    first.close.assert_not_called()
+
+
+def test_mongo_client_is_created_outside_the_lock(mongo_clients):
+    from langflow.components.vectorstores.mongodb_atlas import _get_mongo_client, _mongo_clients_lock
+
+    _, create_client = mongo_clients
+    lock_held = []
+
+    def create(*_args):
+        lock_held.append(_mongo_clients_lock.locked())
+        return MagicMock()
+
+    create_client.side_effect = create
+    _get_mongo_client("mongodb://host")
+
+    assert lock_held == [False]
+
+
+def test_mongo_client_created_by_a_racing_build_is_reused(mongo_clients):
+    from langflow.components.vectorstores.mongodb_atlas import _get_mongo_client
+
+    clients, create_client = mongo_clients
+    cached, duplicate = MagicMock(), MagicMock()
+
+    def create(*_args):
+        # Another build caches its client while this one is connecting
+        clients[("mongodb://host", None)] = cached
+        return duplicate
+
+    create_client.side_effect = create
+
+    assert _get_mongo_client("mongodb://host") is cached
+    duplicate.close.assert_called_once()
+    cached.close.assert_not_called()
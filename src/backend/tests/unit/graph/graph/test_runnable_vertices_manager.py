@@ -34,6 +34,13 @@ def test_from_dict(data):
     assert isinstance(result, RunnableVerticesManager)
 
 
+def test_to_dict__run_map_lists(data):
+    result = RunnableVerticesManager.from_dict(data).to_dict()
+
+    assert sorted(result["run_map"]["A"]) == ["B", "C"]
+    assert isinstance(result["run_map"]["A"], list)
+
+
 def test_from_dict_without_run_map__bad_case(data):
     data.pop("run_map")
 
@@ -86,6 +93,17 @@ def test_update_run_state(data):
     assert "D" in manager.run_predecessors["E"]
 
 
+def test_update_run_state__adds_only_new_edges(data):
+    manager = RunnableVerticesManager.from_dict(data)
+    run_predecessors = {"D": {"B", "C"}, "E": {"A", "D"}}
+
+    manager.update_run_state(run_predecessors, {"E"})
+
+    assert manager.run_map["A"] == {"B", "C", "E"}
+    assert manager.run_map["B"] == {"D"}
+    assert manager.run_map["D"] == {"E"}
+
+
 def test_is_vertex_runnable(data):
     manager = RunnableVerticesManager.from_dict(data)
     vertex_id = "A"
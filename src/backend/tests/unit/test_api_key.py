@@ -1,6 +1,15 @@
+import asyncio
+from uuid import UUID
+
 import pytest
 from httpx import AsyncClient
-from langflow.services.database.models.api_key import ApiKeyCreate
+from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate
+from langflow.services.database.models.api_key.crud import (
+    pending_total_uses,
+    update_total_uses,
+    update_total_uses_tasks,
+)
+from langflow.services.deps import session_scope
 
 
 @pytest.fixture
@@ -16,6 +25,18 @@ async def api_key(
     return response.json()
 
 
+async def wait_for_usage_updates():
+    while update_total_uses_tasks:
+        await asyncio.gather(*update_total_uses_tasks)
+
+
+async def get_api_key_row(api_key_id: str) -> ApiKey:
+    async with session_scope() as session:
+        api_key = await session.get(ApiKey, UUID(api_key_id))
+        assert api_key is not None
+        return api_key
+
+
 @pytest.mark.usefixtures("api_key")
 async def test_get_api_keys(client: AsyncClient, logged_in_headers):
     response = await client.get("api/v1/api_key/", headers=logged_in_headers)
@@ -47,3 +68,65 @@ async def test_delete_api_key(client, logged_in_headers, api_key):
     data = response.json()
     assert data["detail"] == "API Key deleted"
     # Optionally, add a follow-up check to ensure that the key is actually removed from the database
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_deleted_api_key_is_rejected(client, logged_in_headers, api_key):
+    headers = {"x-api-key": api_key["api_key"]}
+    # The first request caches the key, the deletion must evict it
+    response = await client.post(f"api/v1/process/{api_key['id']}", headers=headers)
+    assert response.status_code == 400
+
+    response = await client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    assert response.status_code == 200
+
+    response = await client.post(f"api/v1/process/{api_key['id']}", headers=headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_api_key_uses_are_all_counted(client, api_key):
+    headers = {"x-api-key": api_key["api_key"]}
+
+    # The first request caches the key, so the later ones are cache hits. Requests made before
+    # the pending update is written are coalesced into it, and the concurrent ones overlap
+    for _ in range(3):
+        response = await client.get("api/v1/users/whoami", headers=headers)
+        assert response.status_code == 200, response.text
+    responses = await asyncio.gather(*(client.get("api/v1/users/whoami", headers=headers) for _ in range(5)))
+    assert all(response.status_code == 200 for response in responses)
+    await wait_for_usage_updates()
+
+    response = await client.get("api/v1/users/whoami", headers=headers)
+    assert response.status_code == 200
+    await wait_for_usage_updates()
+
+    api_key_row = await get_api_key_row(api_key["id"])
+    assert api_key_row.total_uses == 9
+    assert api_key_row.last_used_at is not None
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_update_total_uses_increments_atomically(api_key):
+    api_key_id = UUID(api_key["id"])
+    pending_total_uses[api_key_id] = 3
+    await update_total_uses(api_key_id)
+    # Without a pending count each update adds one use. Overlapping updates must not overwrite each other
+    await asyncio.gather(*(update_total_uses(api_key_id) for _ in range(4)))
+
+    api_key_row = await get_api_key_row(api_key["id"])
+    assert api_key_row.total_uses == 7
+    assert api_key_row.last_used_at is not None
+    assert api_key_id not in pending_total_uses
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_update_total_uses_of_deleted_key(client, logged_in_headers, api_key):
+    api_key_id = UUID(api_key["id"])
+    response = await client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    assert response.status_code == 200
+
+    pending_total_uses[api_key_id] = 2
+    with pytest.raises(ValueError, match="API Key not found"):
+        await update_total_uses(api_key_id)
+    assert api_key_id not in pending_total_uses
@@ -1,4 +1,5 @@
 import json
+import math
 from typing import NamedTuple
 from uuid import UUID, uuid4
 
@@ -625,6 +626,18 @@ async def test_sqlite_pragmas():
         assert (await session.exec(text("PRAGMA synchronous;"))).scalar() == 1
 
 
+def test_json_serializer_keeps_non_finite_floats():
+    from langflow.services.database.service import _json_deserializer, _json_serializer
+
+    value = {"score": float("nan"), "bounds": [float("inf"), -float("inf")], "empty": None}
+    restored = _json_deserializer(_json_serializer(value))
+
+    assert math.isnan(restored["score"])
+    assert restored["bounds"] == [float("inf"), -float("inf")]
+    assert restored["empty"] is None
+    assert _json_serializer({"empty": None, "count": 1}) == '{"empty":null,"count":1}'
+
+
 @pytest.mark.usefixtures("active_user")
 async def test_read_folder(client: AsyncClient, logged_in_headers):
     # Create a new folder
@@ -1,3 +1,4 @@
+from contextlib import aclosing
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
@@ -8,6 +9,7 @@ from langflow.memory import (
     add_messages,
     adelete_messages,
     aget_messages,
+    aiter_messages,
     astore_message,
     aupdate_messages,
     delete_messages,
@@ -76,6 +78,36 @@ async def test_aget_messages():
     assert messages[1].text == "Test message 2"
 
 
+@pytest.mark.usefixtures("client")
+async def test_aiter_messages():
+    await aadd_messages(
+        [
+            Message(text="Test message 1", sender="User", sender_name="User", session_id="session_id3"),
+            Message(text="Test message 2", sender="User", sender_name="User", session_id="session_id3"),
+        ]
+    )
+    messages = [message async for message in aiter_messages(sender="User", session_id="session_id3")]
+    assert len(messages) == 2
+    assert {message.text for message in messages} == {"Test message 1", "Test message 2"}
+    assert all(isinstance(message, Message) for message in messages)
+
+
+@pytest.mark.usefixtures("client")
+async def test_aiter_messages_stop_early():
+    await aadd_messages(
+        [
+            Message(text="Test message 1", sender="User", sender_name="User", session_id="session_id4"),
+            Message(text="Test message 2", sender="User", sender_name="User", session_id="session_id4"),
+        ]
+    )
+    async with aclosing(aiter_messages(session_id="session_id4")) as messages:
+        async for message in messages:
+            assert isinstance(message, Message)
+            break
+
+    assert len(await aget_messages(session_id="session_id4")) == 2
+
+
 @pytest.mark.usefixtures("client")
 def test_add_messages():
     message = Message(text="New Test message", sender="User", sender_name="User", session_id="new_session_id")
@@ -100,6 +132,15 @@ async def test_aadd_messagetables(async_session):
     assert added_messages[0].text == "New Test message"
 
 
+async def test_aadd_messagetables_empty(async_session):
+    assert await aadd_messagetables([], async_session) == []
+
+
+@pytest.mark.usefixtures("client")
+async def test_aadd_messages_empty():
+    assert await aadd_messages([]) == []
+
+
 @pytest.mark.usefixtures("client")
 def test_delete_messages():
     session_id = "new_session_id"